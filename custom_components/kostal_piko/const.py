@@ -50,19 +50,44 @@ class KostalPikoFormatter():
         return KostalPikoFormatter.INVERTER_STATES.get(value)
 
 
+GROUP_CURRENT = "current"
+GROUP_DC_INPUTS = "dc_inputs"
+GROUP_PHASES = "phases"
+GROUP_DAILY = "daily"
+GROUP_TOTALS = "totals"
+GROUP_STATUS = "status"
+GROUP_HOME_CONSUMPTION = "home_consumption"
+
+SENSOR_GROUPS = (
+    GROUP_CURRENT,
+    GROUP_DC_INPUTS,
+    GROUP_PHASES,
+    GROUP_DAILY,
+    GROUP_TOTALS,
+    GROUP_STATUS,
+    GROUP_HOME_CONSUMPTION,
+)
+
+
 class KostalPikoSensorEntityDescription():
     """A class that describes Kostal PIKO PIKO entities."""
 
     description: SensorEntityDescription = None
     dxs_id: int = None
+    group: str = None
     formatter: Callable[[str], Any] = None
 
     def __init__(self, description: SensorEntityDescription, dxs_id: int,
-                 formatter: Callable[[str], Any] = None):
+                 group: str, formatter: Callable[[str], Any] = None):
         self.description = description
         self.dxs_id = dxs_id
+        self.group = group
         self.formatter = formatter
 
+    def matches(self, selectors: list[str]) -> bool:
+        """Return True if the sensor key or its group is in selectors."""
+        return self.description.key in selectors or self.group in selectors
+
 
 SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
     # Current DC Input
@@ -75,6 +100,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfPower.KILO_WATT,
             icon="mdi:solar-panel"),
         dxs_id=33556736,
+        group=GROUP_CURRENT,
         formatter=KostalPikoFormatter.format_energy
     ),
 
@@ -88,6 +114,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfPower.KILO_WATT,
             icon="mdi:solar-power"),
         dxs_id=67109120,
+        group=GROUP_CURRENT,
         formatter=KostalPikoFormatter.format_energy
     ),
 
@@ -101,6 +128,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfPower.KILO_WATT,
             icon="mdi:power-plug"),
         dxs_id=83888128,
+        group=GROUP_CURRENT,
         formatter=KostalPikoFormatter.format_energy
     ),
 
@@ -114,6 +142,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
             icon="mdi:power-plug"),
         dxs_id=33555201,
+        group=GROUP_DC_INPUTS,
         formatter=KostalPikoFormatter.format_float
     ),
     KostalPikoSensorEntityDescription(
@@ -125,6 +154,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfElectricPotential.VOLT,
             icon="mdi:power-plug"),
         dxs_id=33555202,
+        group=GROUP_DC_INPUTS,
         formatter=KostalPikoFormatter.format_float
     ),
     KostalPikoSensorEntityDescription(
@@ -136,6 +166,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfPower.WATT,
             icon="mdi:power-plug"),
         dxs_id=33555203,
+        group=GROUP_DC_INPUTS,
         formatter=KostalPikoFormatter.format_float
     ),
 
@@ -149,6 +180,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
             icon="mdi:power-plug"),
         dxs_id=33555457,
+        group=GROUP_DC_INPUTS,
         formatter=KostalPikoFormatter.format_float
     ),
     KostalPikoSensorEntityDescription(
@@ -160,6 +192,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfElectricPotential.VOLT,
             icon="mdi:power-plug"),
         dxs_id=33555458,
+        group=GROUP_DC_INPUTS,
         formatter=KostalPikoFormatter.format_float
     ),
     KostalPikoSensorEntityDescription(
@@ -171,6 +204,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfPower.WATT,
             icon="mdi:power-plug"),
         dxs_id=33555459,
+        group=GROUP_DC_INPUTS,
         formatter=KostalPikoFormatter.format_float
     ),
 
@@ -184,6 +218,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
             icon="mdi:power-plug"),
         dxs_id=33555713,
+        group=GROUP_DC_INPUTS,
         formatter=KostalPikoFormatter.format_float
     ),
     KostalPikoSensorEntityDescription(
@@ -195,6 +230,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfElectricPotential.VOLT,
             icon="mdi:power-plug"),
         dxs_id=33555714,
+        group=GROUP_DC_INPUTS,
         formatter=KostalPikoFormatter.format_float
     ),
     KostalPikoSensorEntityDescription(
@@ -206,6 +242,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfPower.WATT,
             icon="mdi:power-plug"),
         dxs_id=33555715,
+        group=GROUP_DC_INPUTS,
         formatter=KostalPikoFormatter.format_float
     ),
 
@@ -219,6 +256,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfFrequency.HERTZ,
             icon="mdi:power-plug"),
         dxs_id=67110400,
+        group=GROUP_CURRENT,
         formatter=KostalPikoFormatter.format_float
     ),
 
@@ -232,6 +270,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
             icon="mdi:power-plug"),
         dxs_id=67109377,
+        group=GROUP_PHASES,
         formatter=KostalPikoFormatter.format_float
     ),
     KostalPikoSensorEntityDescription(
@@ -243,6 +282,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfElectricPotential.VOLT,
             icon="mdi:power-plug"),
         dxs_id=67109378,
+        group=GROUP_PHASES,
         formatter=KostalPikoFormatter.format_float
     ),
     KostalPikoSensorEntityDescription(
@@ -254,6 +294,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfPower.WATT,
             icon="mdi:lightning-bolt"),
         dxs_id=67109379,
+        group=GROUP_PHASES,
         formatter=KostalPikoFormatter.format_float
     ),
 
@@ -267,6 +308,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
             icon="mdi:power-plug"),
         dxs_id=67109633,
+        group=GROUP_PHASES,
         formatter=KostalPikoFormatter.format_float
     ),
     KostalPikoSensorEntityDescription(
@@ -278,6 +320,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfElectricPotential.VOLT,
             icon="mdi:power-plug"),
         dxs_id=67109634,
+        group=GROUP_PHASES,
         formatter=KostalPikoFormatter.format_float
     ),
     KostalPikoSensorEntityDescription(
@@ -289,6 +332,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfPower.WATT,
             icon="mdi:lightning-bolt"),
         dxs_id=67109635,
+        group=GROUP_PHASES,
         formatter=KostalPikoFormatter.format_float
     ),
 
@@ -302,6 +346,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
             icon="mdi:power-plug"),
         dxs_id=67109889,
+        group=GROUP_PHASES,
         formatter=KostalPikoFormatter.format_float
     ),
     KostalPikoSensorEntityDescription(
@@ -313,6 +358,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfElectricPotential.VOLT,
             icon="mdi:power-plug"),
         dxs_id=67109890,
+        group=GROUP_PHASES,
         formatter=KostalPikoFormatter.format_float
     ),
     KostalPikoSensorEntityDescription(
@@ -324,6 +370,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfPower.WATT,
             icon="mdi:lightning-bolt"),
         dxs_id=67109891,
+        group=GROUP_PHASES,
         formatter=KostalPikoFormatter.format_float
     ),
 
@@ -337,6 +384,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
             icon="mdi:power-plug"),
         dxs_id=251658754,
+        group=GROUP_DAILY,
         formatter=KostalPikoFormatter.format_energy
     ),
 
@@ -350,6 +398,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
             icon="mdi:calendar-today"),
         dxs_id=251659010,
+        group=GROUP_DAILY,
         formatter=KostalPikoFormatter.format_energy
     ),
 
@@ -363,6 +412,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
             icon="mdi:home-lightning-bolt-outline"),
         dxs_id=251659266,
+        group=GROUP_DAILY,
         formatter=KostalPikoFormatter.format_energy
     ),
 
@@ -376,6 +426,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=PERCENTAGE,
             icon="mdi:calendar-today"),
         dxs_id=251659278,
+        group=GROUP_DAILY,
         formatter=KostalPikoFormatter.format_float
     ),
 
@@ -389,6 +440,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=PERCENTAGE,
             icon="mdi:recycle-variant"),
         dxs_id=251659279,
+        group=GROUP_DAILY,
         formatter=KostalPikoFormatter.format_float
     ),
 
@@ -402,6 +454,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
             icon="mdi:power-plug"),
         dxs_id=251658753,
+        group=GROUP_TOTALS,
         formatter=KostalPikoFormatter.format_float
     ),
 
@@ -415,6 +468,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
             icon="mdi:power-plug"),
         dxs_id=251659009,
+        group=GROUP_TOTALS,
         formatter=KostalPikoFormatter.format_float
     ),
 
@@ -428,6 +482,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
             icon="mdi:power-plug"),
         dxs_id=251659265,
+        group=GROUP_TOTALS,
         formatter=KostalPikoFormatter.format_float
     ),
 
@@ -441,6 +496,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=PERCENTAGE,
             icon="mdi:power-plug"),
         dxs_id=251659280,
+        group=GROUP_TOTALS,
         formatter=KostalPikoFormatter.format_float
     ),
 
@@ -454,6 +510,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=PERCENTAGE,
             icon="mdi:power-plug"),
         dxs_id=251659281,
+        group=GROUP_TOTALS,
         formatter=KostalPikoFormatter.format_float
     ),
 
@@ -468,6 +525,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=None,
             icon="mdi:power-plug"),
         dxs_id=16780032,
+        group=GROUP_STATUS,
         formatter=KostalPikoFormatter.format_inverter_state
     ),
 
@@ -481,6 +539,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfTime.HOURS,
             icon="mdi:timer-outline"),
         dxs_id=251658496,
+        group=GROUP_STATUS,
         formatter=KostalPikoFormatter.format_float
     ),
 
@@ -494,6 +553,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfPower.KILO_WATT,
             icon="mdi:solar-power"),
         dxs_id=83886336,
+        group=GROUP_HOME_CONSUMPTION,
         formatter=KostalPikoFormatter.format_energy
     ),
 
@@ -507,6 +567,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfPower.KILO_WATT,
             icon="mdi:home-battery"),
         dxs_id=83886592,
+        group=GROUP_HOME_CONSUMPTION,
         formatter=KostalPikoFormatter.format_energy
     ),
 
@@ -520,6 +581,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfPower.KILO_WATT,
             icon="mdi:transmission-tower-export"),
         dxs_id=83886848,
+        group=GROUP_HOME_CONSUMPTION,
         formatter=KostalPikoFormatter.format_energy
     ),
 
@@ -533,6 +595,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfPower.WATT,
             icon="mdi:power-plug"),
         dxs_id=83887106,
+        group=GROUP_HOME_CONSUMPTION,
         formatter=KostalPikoFormatter.format_float
     ),
 
@@ -546,6 +609,7 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfPower.WATT,
             icon="mdi:power-plug"),
         dxs_id=83887362,
+        group=GROUP_HOME_CONSUMPTION,
         formatter=KostalPikoFormatter.format_float
     ),
 
@@ -559,5 +623,6 @@ SENSOR_DESCRIPTIONS: tuple[KostalPikoSensorEntityDescription, ...] = (
             native_unit_of_measurement=UnitOfPower.WATT,
             icon="mdi:power-plug"),
         dxs_id=83887618,
+        group=GROUP_HOME_CONSUMPTION,
         formatter=KostalPikoFormatter.format_float
     ))
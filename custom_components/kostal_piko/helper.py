@@ -1,29 +1,147 @@
+import asyncio
+import json
+import logging
+import time
 from numbers import Number
-import requests
+import aiohttp
 
+_LOGGER = logging.getLogger(__name__)
+
+
+class KostalPikoOfflineError(Exception):
+    """Raised when a request is skipped because the host is backing off."""
+
+
+class KostalPikoHealth:
+    """Tracks the health of a single inverter host.
+
+    All methods are called from the event loop, so no locking is needed.
+    """
+    STATE_OK = "ok"
+    STATE_DEGRADED = "degraded"
+    STATE_OFFLINE = "offline"
+
+    # Consecutive failures before the host is considered offline
+    OFFLINE_THRESHOLD = 3
+    BACKOFF_INITIAL = 10
+    BACKOFF_MAX = 300
 
-class KostalPikoClient:
     def __init__(self, host: str):
+        self._host = host
+        self._failures = 0
+        self._backoff = 0
+        self._retry_at = 0.0
+
+    @property
+    def state(self) -> str:
+        """Return the current health state of the host."""
+        if self._failures == 0:
+            return self.STATE_OK
+        if self._failures < self.OFFLINE_THRESHOLD:
+            return self.STATE_DEGRADED
+        return self.STATE_OFFLINE
+
+    def should_skip(self) -> bool:
+        """Return True while an offline host is backing off."""
+        return (self.state == self.STATE_OFFLINE
+                and time.monotonic() < self._retry_at)
+
+    def record_success(self):
+        """Mark the host as reachable and reset the backoff."""
+        if self._failures:
+            _LOGGER.info(f'Kostal PIKO {self._host} recovered')
+        self._failures = 0
+        self._backoff = 0
+        self._retry_at = 0.0
+
+    def record_failure(self):
+        """Count a transport failure and extend the backoff if offline.
+
+        The backoff only grows once per expired backoff period, so failures
+        of requests running in parallel do not escalate it.
+        """
+        self._failures += 1
+        if self._failures < self.OFFLINE_THRESHOLD:
+            return
+
+        now = time.monotonic()
+        if now < self._retry_at:
+            return
+
+        if not self._backoff:
+            _LOGGER.warning(
+                f'Kostal PIKO {self._host} is offline, backing off')
+        self._backoff = min(self._backoff * 2 or self.BACKOFF_INITIAL,
+                            self.BACKOFF_MAX)
+        self._retry_at = now + self._backoff
+
+
+class KostalPikoClient:
+    # Number of concurrent requests allowed against a single inverter
+    MAX_REQUESTS = 2
+
+    def __init__(self, session: aiohttp.ClientSession, host: str,
+                 timeout: float = 10):
+        self._session = session
         self._host = host
         self._url = "http://" + self._host + "/api/dxs.json?dxsEntries="
+        self._timeout = timeout
+        self._slots = asyncio.Semaphore(self.MAX_REQUESTS)
+        self.health = KostalPikoHealth(host)
 
-    def get_data(self, dxs_id: Number):
-        response = requests.get(url=self._url + str(dxs_id), timeout=10)
+    async def async_get_data(self, dxs_id: Number):
+        """Fetch a single value from the inverter.
 
-        try:
-            data = response.json()
+        Requests only queue behind other requests of the same host. Each
+        request runs on the event loop and is cancelled once the timeout
+        expires. Transport errors, HTTP errors and unparsable responses count
+        against the health of the host; a valid response lacking a single
+        value does not.
+        """
+        if self.health.should_skip():
+            raise KostalPikoOfflineError(
+                f'Kostal PIKO {self._host} is offline, skipping')
 
+        async with self._slots:
+            # The host may have gone offline while this request was queued
+            if self.health.should_skip():
+                raise KostalPikoOfflineError(
+                    f'Kostal PIKO {self._host} is offline, skipping')
+
+            text = ''
+            try:
+                async with asyncio.timeout(self._timeout):
+                    async with self._session.get(
+                            self._url + str(dxs_id)) as response:
+                        response.raise_for_status()
+                        text = await response.text()
+                data = json.loads(text)
+            except TimeoutError:
+                self.health.record_failure()
+                raise Exception(
+                    f'Kostal PIKO {self._host} did not answer within '
+                    f'{self._timeout}s for dxsId {dxs_id}')
+            except aiohttp.ClientError as e:
+                self.health.record_failure()
+                raise Exception(
+                    f'Kostal PIKO {self._host} request failed for dxsId {dxs_id}: {repr(e)}'
+                )
+            except ValueError as e:
+                self.health.record_failure()
+                raise Exception(
+                    f'Kostal response has invalid format. Response was {text}: {repr(e)}'
+                )
+
+        self.health.record_success()
+
+        try:
             for entry in data['dxsEntries']:
                 if entry['dxsId'] == dxs_id:
                     return entry['value']
         except KeyError as e:
             raise Exception(
-                f'Kostal response does not match expected format for dxsId {dxs_id}. Got error {repr(e)} for response {response.text}'
-            )
-        except requests.exceptions.JSONDecodeError as e:
-            raise Exception(
-                f'Kostal response has invalid format. Response was {response.text}: {repr(e)}'
+                f'Kostal response does not match expected format for dxsId {dxs_id}. Got error {repr(e)} for response {text}'
             )
 
         raise Exception(
-            f'Kostal response did not contain dxs_id {dxs_id}: {response.text}')
+            f'Kostal response did not contain dxs_id {dxs_id}: {text}')
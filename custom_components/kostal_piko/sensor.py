@@ -14,42 +14,63 @@ from homeassistant.components.sensor import (
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
-from homeassistant.const import (CONF_HOST)
+from homeassistant.const import (CONF_EXCLUDE, CONF_HOST, CONF_INCLUDE,
+                                 CONF_TIMEOUT)
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from homeassistant.util import Throttle
 
 from .const import (
     SENSOR_DESCRIPTIONS,
+    SENSOR_GROUPS,
     KostalPikoSensorEntityDescription,
 )
 
-from .helper import KostalPikoClient
+from .helper import KostalPikoClient, KostalPikoOfflineError
 
 MIN_TIME_BETWEEN_UPDATES = timedelta(seconds=10)
 
+SENSOR_SELECTORS = [
+    *SENSOR_GROUPS,
+    *(description.description.key for description in SENSOR_DESCRIPTIONS),
+]
+
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend({
     vol.Required(CONF_HOST): cv.string,
+    vol.Optional(CONF_TIMEOUT, default=10):
+        vol.All(vol.Coerce(int), vol.Range(min=1)),
+    vol.Optional(CONF_INCLUDE):
+        vol.All(cv.ensure_list, [vol.In(SENSOR_SELECTORS)]),
+    vol.Optional(CONF_EXCLUDE, default=[]):
+        vol.All(cv.ensure_list, [vol.In(SENSOR_SELECTORS)]),
 })
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def setup_platform(
+async def async_setup_platform(
     hass: HomeAssistant,
     config: ConfigType,
-    add_entities: AddEntitiesCallback,
+    async_add_entities: AddEntitiesCallback,
     discovery_info: DiscoveryInfoType = None,
 ) -> None:
     """Set up the Kostal PIKO Inverter platform."""
     host = config[CONF_HOST]
     _LOGGER.info(f'Setting up client for Kostal PIKO Inverter {host}...')
-    client = KostalPikoClient(host)
+    client = KostalPikoClient(async_get_clientsession(hass), host,
+                              config[CONF_TIMEOUT])
     _LOGGER.info('Setting up Kostal PIKO Inverter sensors...')
+    include = config.get(CONF_INCLUDE)
+    exclude = config[CONF_EXCLUDE]
     sensors = []
     for description in SENSOR_DESCRIPTIONS:
+        if include is not None and not description.matches(include):
+            continue
+        if description.matches(exclude):
+            continue
         sensors.append(KostalPikoSensor(client, description))
 
-    add_entities(sensors)
+    async_add_entities(sensors, True)
 
 
 class KostalPikoSensor(SensorEntity):
@@ -64,27 +85,35 @@ class KostalPikoSensor(SensorEntity):
         self._dxs_id = description.dxs_id
         self._formatter = description.formatter
 
-        self.update()
-
     @property
     def unique_id(self) -> str:
         """Return the unique id of this Sensor Entity."""
         return f"{self.entry_id}_{self._dxs_id}"
 
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the health state of the inverter serving this sensor."""
+        return {"inverter_health": self._client.health.state}
+
     @Throttle(MIN_TIME_BETWEEN_UPDATES)
-    def update(self):
+    async def async_update(self):
         """Fetch new state data for the sensor.
 
         This is the only method that should fetch new data for Home Assistant.
+        Requests are limited and timed out per inverter so a slow unit only
+        degrades its own entities.
         """
         try:
-            raw_value = self._client.get_data(self._dxs_id)
+            raw_value = await self._client.async_get_data(self._dxs_id)
 
             if self._formatter:
                 raw_value = self._formatter(raw_value)
 
             self._attr_native_value = raw_value
             self._attr_available = True
+        except KostalPikoOfflineError as e:
+            _LOGGER.debug(repr(e))
+            self._attr_available = False
         except Exception as e:
             _LOGGER.error(
                 f"Failed updating sensor {self.entity_description.name}: {repr(e)}"